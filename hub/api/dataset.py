@@ -2,14 +2,17 @@ import os
 import posixpath
 import collections.abc as abc
 import json
+import queue
 import sys
+import threading
 import traceback
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
-import fsspec
 import numcodecs
 import numcodecs.lz4
 import numcodecs.zstd
+import numpy as np
 
 from hub.schema.features import (
     Primitive,
@@ -35,6 +38,7 @@ import hub.schema.serialize
 import hub.schema.deserialize
 from hub.schema.features import flatten
 
+from hub.store.chunk_cache import ChunkCache
 from hub.store.dynamic_tensor import DynamicTensor
 from hub.store.store import get_fs_and_path, get_storage_map
 from hub.exceptions import (
@@ -57,8 +61,103 @@ from hub.utils import norm_cache, norm_shape
 from hub import defaults
 
 
-def get_file_count(fs: fsspec.AbstractFileSystem, path):
-    return len(fs.listdir(path, detail=False))
+def _schema_to_tf(schema):
+    """Returns (output types, output shapes) of a schema for tf.data, in a single walk"""
+    if isinstance(schema, SchemaDict):
+        types, shapes = {}, {}
+        for key, value in schema.dict_.items():
+            types[key], shapes[key] = _schema_to_tf(value)
+        return types, shapes
+    elif isinstance(schema, Tensor):
+        return _schema_to_tf(schema.dtype)[0], schema.shape
+    elif isinstance(schema, Primitive):
+        dtype = str(schema._dtype)
+        return ("string" if dtype == "object" else dtype), ()
+    raise TypeError(f"Schema of type {type(schema)} can't be converted to tensorflow")
+
+
+# leaf value that _build_nested leaves out of the sample
+_OMIT = object()
+
+
+def _nested_ops(skeleton: dict) -> list:
+    """Flattens a sample skeleton into (parent node, key, leaf index) operations in dict order.
+    A leaf index of None creates a new nested dict node, nodes are numbered in creation order
+    """
+    ops = []
+    created = [0]
+
+    def visit(node, node_index):
+        for key, value in node.items():
+            if isinstance(value, dict):
+                created[0] += 1
+                ops.append((node_index, key, None))
+                visit(value, created[0])
+            else:
+                ops.append((node_index, key, value))
+
+    visit(skeleton, 0)
+    return ops
+
+
+def _build_nested(ops, values) -> dict:
+    """Builds a nested sample dict from leaf values in a single pass over the ops,
+    without copying a skeleton or walking paths per leaf
+    """
+    nodes = [{}]
+    for parent, key, value_index in ops:
+        if value_index is None:
+            node = {}
+            nodes[parent][key] = node
+            nodes.append(node)
+        else:
+            value = values[value_index]
+            if value is not _OMIT:
+                nodes[parent][key] = value
+    return nodes[0]
+
+
+_PREFETCH_END = object()
+
+
+def _prefetch(iterable, prefetch: int):
+    """Iterates over iterable in a background thread, keeping up to prefetch items ready.
+    Storage reads release the GIL, so reading ahead overlaps with the consumer's work
+    """
+    ready = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                ready.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def producer():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((_PREFETCH_END, e))
+            return
+        put((_PREFETCH_END, None))
+
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = ready.get()
+            if item is _PREFETCH_END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
 
 
 class Dataset:
@@ -78,6 +177,7 @@ class Dataset:
         tokenizer=None,
         lazy: bool = True,
         public: bool = True,
+        chunk_cache: int = 0,
     ):
         """| Open a new or existing dataset for read/write
 
@@ -112,6 +212,9 @@ class Dataset:
             only applicable if using hub storage, ignored otherwise
             setting this to False allows only the user who created it to access the dataset and
             the dataset won't be visible in the visualizer to the public
+        chunk_cache: int, optional
+            Size of the cache of decompressed chunks of static tensors, speeds up repeated reads of the same samples.
+            Default is 0, cache is not used
         """
 
         shape = norm_shape(shape)
@@ -120,6 +223,7 @@ class Dataset:
         mode = mode or "a"
         storage_cache = norm_cache(storage_cache) if cache else 0
         cache = norm_cache(cache)
+        chunk_cache = norm_cache(chunk_cache)
         schema: SchemaDict = featurify(schema) if schema else None
 
         self._url = url
@@ -133,6 +237,8 @@ class Dataset:
         )
         self._cache = cache
         self._storage_cache = storage_cache
+        self._chunk_cache_size = chunk_cache
+        self._chunk_cache = ChunkCache(chunk_cache) if chunk_cache else None
         self.lock_cache = lock_cache
         self.verison = "1.x"
 
@@ -151,6 +257,7 @@ class Dataset:
             self._meta_information = self.meta["meta_info"]
             self._flat_tensors = tuple(flatten(self.schema))
             self._tensors = dict(self._open_storage_tensors())
+            self._leaf_plan()
             if shape != (None,) and shape != self._shape:
                 raise TypeError(
                     f"Shape in metafile [{self._shape}]  and shape in arguments [{shape}] are !=, use mode='w' to overwrite dataset"
@@ -178,6 +285,7 @@ class Dataset:
                 self._meta_information = self.meta["meta_info"]
                 self._flat_tensors = tuple(flatten(self.schema))
                 self._tensors = dict(self._generate_storage_tensors())
+                self._leaf_plan()
                 self.flush()
             except Exception as e:
                 try:
@@ -188,6 +296,9 @@ class Dataset:
                 logger.error("Deleting the dataset " + traceback.format_exc() + str(e))
                 raise
 
+        self._full_slice = slice(0, self.shape[0])
+        self._tf_leaf_signatures = None
+
         if needcreate and (
             self._path.startswith("s3://snark-hub-dev/")
             or self._path.startswith("s3://snark-hub/")
@@ -226,6 +337,10 @@ class Dataset:
     def storage_cache(self):
         return self._storage_cache
 
+    @property
+    def chunk_cache(self):
+        return self._chunk_cache_size
+
     @property
     def schema(self):
         return self._schema
@@ -248,6 +363,49 @@ class Dataset:
         self._fs_map["meta.json"] = bytes(json.dumps(meta), "utf-8")
         return meta
 
+    def _leaf_plan(self):
+        """Splits tensor paths once into (parent keys, leaf name, tensor key) and builds
+        the nested dict skeleton of a sample, with leaves set to their index in self._leaves
+        """
+        self._leaves = []
+        self._skeleton = {}
+        # every intermediate "/a/b/" prefix -> leaves below it, with parents relative to it
+        self._prefix_index = defaultdict(list)
+        self._keys_tuple = tuple(self._tensors.keys())
+        for key in self._keys_tuple:
+            split_key = key.split("/")
+            parents, leaf = tuple(split_key[1:-1]), split_key[-1]
+            self._leaves.append((parents, leaf, key))
+            cur = self._skeleton
+            for sub_key in parents:
+                cur = cur.setdefault(sub_key, {})
+            cur[leaf] = len(self._leaves) - 1
+            for depth in range(1, len(parents) + 1):
+                prefix = "/" + "/".join(parents[:depth]) + "/"
+                self._prefix_index[prefix].append((parents[depth:], leaf, key))
+        self._build_ops = _nested_ops(self._skeleton)
+        return self._skeleton
+
+    def _list_dir(self):
+        """
+        Lists file names in the dataset folder with a single request.
+        Returns None if the folder doesn't exist.
+        """
+        fs, path = self._fs, self._path
+        try:
+            return [
+                posixpath.basename(f.rstrip("/")) for f in fs.ls(path, detail=False)
+            ]
+        except FileNotFoundError:
+            return None
+        except NotImplementedError:
+            # filesystems without listing support
+            if fs.exists(posixpath.join(path, "meta.json")):
+                return ["meta.json"]
+            if not fs.exists(path):
+                return None
+            return fs.listdir(path, detail=False)
+
     def _check_and_prepare_dir(self):
         """
         Checks if input data is ok.
@@ -264,8 +422,8 @@ class Dataset:
                     fs.listdir(path)
                 except:
                     raise WrongUsernameException(stored_username)
-        exist_meta = fs.exists(posixpath.join(path, "meta.json"))
-        if exist_meta:
+        files = self._list_dir()
+        if files is not None and "meta.json" in files:
             if "w" in mode:
                 fs.rm(path, recursive=True)
                 fs.makedirs(path)
@@ -274,10 +432,9 @@ class Dataset:
         else:
             if "r" in mode:
                 raise HubDatasetNotFoundException(path)
-            exist_dir = fs.exists(path)
-            if not exist_dir:
+            if files is None:
                 fs.makedirs(path)
-            elif get_file_count(fs, path) > 0:
+            elif len(files) > 0:
                 if "w" in mode:
                     raise NotHubDatasetToOverwriteException()
                 else:
@@ -306,50 +463,62 @@ class Dataset:
                 f"Wrong compressor: {compressor}, only LZ4 and ZSTD are supported"
             )
 
-    def _generate_storage_tensors(self):
-        for t in self._flat_tensors:
-            t_dtype, t_path = t
-            path = posixpath.join(self._path, t_path[1:])
+    def _make_storage_map(self, t_path, create=False):
+        path = posixpath.join(self._path, t_path[1:])
+        if create:
             self._fs.makedirs(posixpath.join(path, "--dynamic--"))
+        return MetaStorage(
+            t_path,
+            get_storage_map(
+                self._fs,
+                path,
+                self.cache,
+                self.lock_cache,
+                storage_cache=self._storage_cache,
+            ),
+            self._fs_map,
+        )
+
+    def _make_storage_maps(self, create=False):
+        """Prepares storage maps of all tensors concurrently, as each one may cost
+        a remote round trip. Tensors themselves are then opened sequentially,
+        as they all read and write the shared meta.json
+        """
+        t_paths = [t_path for _, t_path in self._flat_tensors]
+        if len(t_paths) <= 1:
+            return [self._make_storage_map(t_path, create) for t_path in t_paths]
+        with ThreadPoolExecutor(max_workers=min(32, len(t_paths))) as executor:
+            return list(
+                executor.map(
+                    lambda t_path: self._make_storage_map(t_path, create), t_paths
+                )
+            )
+
+    def _generate_storage_tensors(self):
+        fs_maps = self._make_storage_maps(create=True)
+        for (t_dtype, t_path), fs_map in zip(self._flat_tensors, fs_maps):
             yield t_path, DynamicTensor(
-                fs_map=MetaStorage(
-                    t_path,
-                    get_storage_map(
-                        self._fs,
-                        path,
-                        self.cache,
-                        self.lock_cache,
-                        storage_cache=self._storage_cache,
-                    ),
-                    self._fs_map,
-                ),
+                fs_map=fs_map,
                 mode=self.mode,
                 shape=self.shape + t_dtype.shape,
                 max_shape=self.shape + t_dtype.max_shape,
                 dtype=self._get_dynamic_tensor_dtype(t_dtype),
                 chunks=t_dtype.chunks,
                 compressor=self._get_compressor(t_dtype.compressor),
+                chunk_cache=self._chunk_cache,
+                cache_key=t_path,
             )
 
     def _open_storage_tensors(self):
-        for t in self._flat_tensors:
-            t_dtype, t_path = t
-            path = posixpath.join(self._path, t_path[1:])
+        fs_maps = self._make_storage_maps()
+        for (t_dtype, t_path), fs_map in zip(self._flat_tensors, fs_maps):
             yield t_path, DynamicTensor(
-                fs_map=MetaStorage(
-                    t_path,
-                    get_storage_map(
-                        self._fs,
-                        path,
-                        self.cache,
-                        self.lock_cache,
-                        storage_cache=self._storage_cache,
-                    ),
-                    self._fs_map,
-                ),
+                fs_map=fs_map,
                 mode=self.mode,
                 # FIXME We don't need argument below here
                 shape=self.shape + t_dtype.shape,
+                chunk_cache=self._chunk_cache,
+                cache_key=t_path,
             )
 
     def __getitem__(self, slice_):
@@ -362,9 +531,17 @@ class Dataset:
         >>> image = images[5]
         >>> return image[0:1920, 0:1080, 0:3].compute()
         """
+        if isinstance(slice_, int):
+            num, ofs = slice_extract_info(slice_, self.shape[0])
+            return DatasetView(
+                dataset=self,
+                num_samples=num,
+                offset=ofs,
+                squeeze_dim=True,
+                lazy=self.lazy,
+            )
         if not isinstance(slice_, abc.Iterable) or isinstance(slice_, str):
             slice_ = [slice_]
-        slice_ = list(slice_)
         subpath, slice_list = slice_split(slice_)
         if not subpath:
             if len(slice_list) > 1:
@@ -380,18 +557,18 @@ class Dataset:
                 lazy=self.lazy,
             )
         elif not slice_list:
-            if subpath in self._tensors.keys():
+            if subpath in self._tensors:
                 tensorview = TensorView(
                     dataset=self,
                     subpath=subpath,
-                    slice_=slice(0, self.shape[0]),
+                    slice_=self._full_slice,
                     lazy=self.lazy,
                 )
                 if self.lazy:
                     return tensorview
                 else:
                     return tensorview.compute()
-            for key in self._tensors.keys():
+            for key in self._keys_tuple:
                 if subpath.startswith(key):
                     objectview = ObjectView(
                         dataset=self, subpath=subpath, lazy=self.lazy
@@ -404,7 +581,7 @@ class Dataset:
         else:
             num, ofs = slice_extract_info(slice_list[0], self.shape[0])
             schema_obj = self.schema.dict_[subpath.split("/")[1]]
-            if subpath in self._tensors.keys() and (
+            if subpath in self._tensors and (
                 not isinstance(schema_obj, Sequence) or len(slice_list) <= 1
             ):
                 tensorview = TensorView(
@@ -414,7 +591,7 @@ class Dataset:
                     return tensorview
                 else:
                     return tensorview.compute()
-            for key in self._tensors.keys():
+            for key in self._keys_tuple:
                 if subpath.startswith(key):
                     objectview = ObjectView(
                         dataset=self,
@@ -450,12 +627,12 @@ class Dataset:
         if not subpath:
             raise ValueError("Can't assign to dataset sliced without subpath")
         elif not slice_list:
-            if subpath in self._tensors.keys():
+            if subpath in self._tensors:
                 self._tensors[subpath][:] = assign_value  # Add path check
             else:
                 ObjectView(dataset=self, subpath=subpath)[:] = assign_value
         else:
-            if subpath in self._tensors.keys():
+            if subpath in self._tensors:
                 self._tensors[subpath][slice_list] = assign_value
             else:
                 ObjectView(dataset=self, subpath=subpath, slice_list=slice_list)[
@@ -468,6 +645,7 @@ class Dataset:
             return
 
         self._shape = (int(size),)
+        self._full_slice = slice(0, self.shape[0])
         self.meta = self._store_meta()
         for t in self._tensors.values():
             t.resize_shape(int(size))
@@ -499,6 +677,7 @@ class Dataset:
         output_type=dict,
         offset=None,
         num_samples=None,
+        prefetch: int = 0,
     ):
         """| Converts the dataset into a pytorch compatible format.
 
@@ -514,6 +693,13 @@ class Dataset:
             The offset from which dataset needs to be converted
         num_samples: int, optional
             The number of samples required of the dataset that needs to be converted
+        prefetch: int, optional
+            Number of samples read ahead in a background thread when iterating. Default is 0 (disabled).
+            Like the chunk at a time reads, this only applies when the returned object is iterated
+            directly (for sample in ds.to_pytorch()). torch.utils.data.DataLoader indexes samples
+            one by one through __getitem__ and does not use it, use its num_workers and prefetch_factor instead.
+
+        For page-locked memory use torch.utils.data.DataLoader(..., pin_memory=True)
         """
         if "torch" not in sys.modules:
             raise ModuleNotInstalledException("torch")
@@ -529,6 +715,7 @@ class Dataset:
             output_type=output_type,
             offset=offset,
             num_samples=num_samples,
+            prefetch=prefetch,
         )
 
     def to_tensorflow(self, offset=None, num_samples=None):
@@ -540,6 +727,9 @@ class Dataset:
             The offset from which dataset needs to be converted
         num_samples: int, optional
             The number of samples required of the dataset that needs to be converted
+
+        Small static tensors are read into memory right away, up to defaults.TF_TENSOR_SLICES_LIMIT
+        bytes in total, so the returned dataset won't see later writes to them
         """
         if "tensorflow" not in sys.modules:
             raise ModuleNotInstalledException("tensorflow")
@@ -551,81 +741,104 @@ class Dataset:
         offset = 0 if offset is None else offset
         num_samples = self.shape[0] if num_samples is None else num_samples
 
-        def tf_gen():
-            for index in range(offset, offset + num_samples):
-                d = {}
-                for key in self._tensors.keys():
-                    split_key = key.split("/")
-                    cur = d
-                    for i in range(1, len(split_key) - 1):
-                        if split_key[i] in cur.keys():
-                            cur = cur[split_key[i]]
-                        else:
-                            cur[split_key[i]] = {}
-                            cur = cur[split_key[i]]
-                    cur[split_key[-1]] = self._tensors[key][index]
-                yield (d)
-
-        def dict_to_tf(my_dtype):
-            d = {}
-            for k, v in my_dtype.dict_.items():
-                d[k] = dtype_to_tf(v)
-            return d
+        per_key_ds = {}
+        eager_budget = defaults.TF_TENSOR_SLICES_LIMIT
+        for key, (output_type, output_shape) in zip(
+            self._keys_tuple, self._tf_signatures()
+        ):
+            per_key_ds[key], eager_bytes = self._as_tf_tensor_slices(
+                key, offset, num_samples, output_type, output_shape, eager_budget
+            )
+            eager_budget -= eager_bytes
 
-        def tensor_to_tf(my_dtype):
-            return dtype_to_tf(my_dtype.dtype)
-
-        def dtype_to_tf(my_dtype):
-            if isinstance(my_dtype, SchemaDict):
-                return dict_to_tf(my_dtype)
-            elif isinstance(my_dtype, Tensor):
-                return tensor_to_tf(my_dtype)
-            elif isinstance(my_dtype, Primitive):
-                if str(my_dtype._dtype) == "object":
-                    return "string"
-                return str(my_dtype._dtype)
-
-        def get_output_shapes(my_dtype):
-            if isinstance(my_dtype, SchemaDict):
-                return output_shapes_from_dict(my_dtype)
-            elif isinstance(my_dtype, Tensor):
-                return my_dtype.shape
-            elif isinstance(my_dtype, Primitive):
-                return ()
-
-        def output_shapes_from_dict(my_dtype):
-            d = {}
-            for k, v in my_dtype.dict_.items():
-                d[k] = get_output_shapes(v)
-            return d
+        def to_nested(flat):
+            return _build_nested(
+                self._build_ops, [flat[key] for key in self._keys_tuple]
+            )
+
+        return (
+            tf.data.Dataset.zip(per_key_ds)
+            .map(to_nested, num_parallel_calls=tf.data.experimental.AUTOTUNE)
+            .prefetch(tf.data.experimental.AUTOTUNE)
+        )
+
+    def _tf_signatures(self):
+        """(output type, output shape) of every tensor for tf.data, ordered as self._leaves.
+        Computed once, on first conversion
+        """
+        if self._tf_leaf_signatures is None:
+            self._tf_leaf_signatures = [
+                _schema_to_tf(t_dtype) for t_dtype, _ in self._flat_tensors
+            ]
+        return self._tf_leaf_signatures
+
+    def _as_tf_tensor_slices(
+        self, key, offset, num_samples, output_type, output_shape, eager_budget
+    ):
+        """Builds a single tensor tf.data pipeline for samples [offset, offset + num_samples)
+        Returns the pipeline and the number of bytes read eagerly for it
+
+        Static tensors that fit into eager_budget bytes are read in one go and sliced by tf.data,
+        others are read sample by sample in parallel through tf.numpy_function. Types tf can't
+        represent natively (strings, nested sequences) fall back to a python generator.
+        """
+        tensor = self._tensors[key]
+        if not isinstance(output_type, str) or output_type == "string":
+
+            def tf_gen():
+                for index in range(offset, offset + num_samples):
+                    yield tensor[index]
+
+            return (
+                tf.data.Dataset.from_generator(
+                    tf_gen, output_types=output_type, output_shapes=output_shape
+                ),
+                0,
+            )
+
+        tf_dtype = tf.as_dtype(output_type)
+        sample_size = tensor.dtype.itemsize
+        for dim in tensor.max_shape[1:]:
+            sample_size *= dim
+        if not tensor.is_dynamic and sample_size * num_samples <= eager_budget:
+            return (
+                tf.data.Dataset.from_tensor_slices(
+                    tensor[offset : offset + num_samples]
+                ),
+                sample_size * num_samples,
+            )
+
+        def read_sample(index):
+            return tensor[int(index)]
 
-        output_types = dtype_to_tf(self.schema)
-        output_shapes = get_output_shapes(self.schema)
+        def tf_read(index):
+            sample = tf.numpy_function(read_sample, [index], tf_dtype)
+            sample.set_shape(output_shape)
+            return sample
 
-        return tf.data.Dataset.from_generator(
-            tf_gen, output_types=output_types, output_shapes=output_shapes
+        return (
+            tf.data.Dataset.range(offset, offset + num_samples).map(
+                tf_read, num_parallel_calls=tf.data.experimental.AUTOTUNE
+            ),
+            0,
         )
 
     def _get_dictionary(self, subpath, slice_=None):
         """Gets dictionary from dataset given incomplete subpath"""
-        tensor_dict = {}
         subpath = subpath if subpath.endswith("/") else subpath + "/"
-        for key in self._tensors.keys():
-            if key.startswith(subpath):
-                suffix_key = key[len(subpath) :]
-                split_key = suffix_key.split("/")
-                cur = tensor_dict
-                for i in range(len(split_key) - 1):
-                    if split_key[i] not in cur.keys():
-                        cur[split_key[i]] = {}
-                    cur = cur[split_key[i]]
-                slice_ = slice_ or slice(0, self.shape[0])
-                tensorview = TensorView(
-                    dataset=self, subpath=key, slice_=slice_, lazy=self.lazy
-                )
-                cur[split_key[-1]] = tensorview if self.lazy else tensorview.compute()
-        if not tensor_dict:
+        leaves = self._prefix_index.get(subpath)
+        if not leaves:
             raise KeyError(f"Key {subpath} was not found in dataset")
+        slice_ = self._full_slice if slice_ is None else slice_
+        tensor_dict = {}
+        for parents, leaf, key in leaves:
+            cur = tensor_dict
+            for sub_key in parents:
+                cur = cur.setdefault(sub_key, {})
+            tensorview = TensorView(
+                dataset=self, subpath=key, slice_=slice_, lazy=self.lazy
+            )
+            cur[leaf] = tensorview if self.lazy else tensorview.compute()
         return tensor_dict
 
     def __iter__(self):
@@ -633,6 +846,49 @@ class Dataset:
         for i in range(len(self)):
             yield self[i]
 
+    def iter(self, prefetch: int = 4):
+        """| Returns Iterable over computed samples (nested dicts of numpy arrays)
+
+        Parameters
+        ----------
+        prefetch: int, optional
+            Number of samples read ahead in a background thread while the current one is processed.
+            If 0, samples are read in the calling thread
+        """
+        samples = (create_numpy_dict(self, i) for i in range(len(self)))
+        return _prefetch(samples, prefetch) if prefetch else samples
+
+    def _iter_batched(self, batch=None, offset=0, num_samples=None, copy=False):
+        """Yields raw samples in [offset, offset + num_samples) as lists of values ordered as self._leaves
+
+        Each tensor is read a block at a time instead of a sample at a time, so a chunk is
+        fetched and decoded once per block. By default a block is one chunk of that tensor,
+        aligned to chunk boundaries; `batch` forces the same block length for all tensors.
+        Values are views into the block unless `copy` is set.
+        Tensors with dynamic shapes can't be read across samples and are read one by one.
+        """
+        stop = len(self) if num_samples is None else offset + num_samples
+        tensors = [self._tensors[key] for _, _, key in self._leaves]
+        sizes = [batch or max(tensor.chunksize[0], 1) for tensor in tensors]
+        blocks = [(0, 0, None)] * len(tensors)
+        for index in range(offset, stop):
+            values = []
+            for i, tensor in enumerate(tensors):
+                if tensor.is_dynamic:
+                    values.append(tensor[index])
+                    continue
+                start, end, block = blocks[i]
+                if not start <= index < end:
+                    start = index - index % sizes[i]
+                    end = min(start + sizes[i], stop)
+                    block = tensor[start:end]
+                    blocks[i] = (start, end, block)
+                value = block[index - start]
+                if copy and isinstance(value, np.ndarray):
+                    value = value.copy()
+                values.append(value)
+            yield values
+
     def __len__(self):
         """ Number of samples in the dataset """
         return self.shape[0]
@@ -1103,15 +1359,18 @@ class TorchDataset:
         output_type=dict,
         num_samples=None,
         offset=None,
+        prefetch=0,
     ):
         self._ds = None
         self._url = ds.url
         self._token = ds.token
+        self._chunk_cache = ds.chunk_cache
         self._transform = transform
         self.inplace = inplace
         self.output_type = output_type
         self.num_samples = num_samples
         self.offset = offset
+        self.prefetch = prefetch
 
     def _do_transform(self, data):
         return self._transform(data) if self._transform else data
@@ -1121,7 +1380,17 @@ class TorchDataset:
         For each process, dataset should be independently loaded
         """
         if self._ds is None:
-            self._ds = Dataset(self._url, token=self._token, lock_cache=False)
+            self._ds = Dataset(
+                self._url,
+                token=self._token,
+                lock_cache=False,
+                chunk_cache=self._chunk_cache,
+            )
+            self._init_sample_plan()
+
+    def _init_sample_plan(self):
+        """Resolves tensor handles once per process, paths come from the dataset leaf plan"""
+        self._tensor_refs = [self._ds._tensors[key] for _, _, key in self._ds._leaves]
 
     def __len__(self):
         self._init_ds()
@@ -1130,27 +1399,32 @@ class TorchDataset:
     def __getitem__(self, index):
         index = index + self.offset if self.offset is not None else index
         self._init_ds()
-        d = {}
-        for key in self._ds._tensors.keys():
-            split_key = key.split("/")
-            cur = d
-            for i in range(1, len(split_key) - 1):
-                if split_key[i] not in cur.keys():
-                    cur[split_key[i]] = {}
-                cur = cur[split_key[i]]
-            if not isinstance(self._ds._tensors[key][index], bytes) and not isinstance(
-                self._ds._tensors[key][index], str
-            ):
-                t = self._ds._tensors[key][index]
-                if self.inplace:
-                    t = torch.tensor(t)
-                cur[split_key[-1]] = t
+        return self._build_sample([ref[index] for ref in self._tensor_refs])
+
+    def _build_sample(self, values):
+        """Builds the output sample from raw values ordered as the dataset leaves"""
+        converted = []
+        for t in values:
+            if isinstance(t, (bytes, str)):
+                t = _OMIT
+            elif self.inplace:
+                t = (
+                    torch.from_numpy(t)
+                    if isinstance(t, np.ndarray)
+                    else torch.as_tensor(t)
+                )
+            converted.append(t)
+        d = _build_nested(self._ds._build_ops, converted)
         d = self._do_transform(d)
         if self.inplace & (self.output_type != dict) & (type(d) == dict):
             d = self.output_type(d.values())
         return d
 
     def __iter__(self):
+        """Iterates over samples, reading each tensor a chunk at a time
+        Not used by torch.utils.data.DataLoader, which goes through __getitem__
+        """
         self._init_ds()
-        for i in range(len(self)):
-            yield self[i]
+        values = self._ds._iter_batched(offset=self.offset or 0, num_samples=len(self))
+        samples = map(self._build_sample, values)
+        yield from _prefetch(samples, self.prefetch) if self.prefetch else samples
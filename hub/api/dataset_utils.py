@@ -72,14 +72,11 @@ def slice_extract_info(slice_, num):
 
 def create_numpy_dict(dataset, index):
     numpy_dict = {}
-    for path in dataset._tensors.keys():
+    for parents, leaf, path in dataset._leaves:
         d = numpy_dict
-        split = path.split("/")
-        for subpath in split[1:-1]:
-            if subpath not in d:
-                d[subpath] = {}
-            d = d[subpath]
-        d[split[-1]] = dataset[path, index].numpy()
+        for subpath in parents:
+            d = d.setdefault(subpath, {})
+        d[leaf] = dataset[path, index].numpy()
     return numpy_dict
 
 
@@ -81,7 +81,7 @@ class DatasetView:
                 if not self.squeeze_dim
                 else self.offset
             )
-            if subpath in self.dataset._tensors.keys():
+            if subpath in self.dataset._tensors:
                 tensorview = TensorView(
                     dataset=self.dataset,
                     subpath=subpath,
@@ -89,7 +89,7 @@ class DatasetView:
                     lazy=self.lazy,
                 )
                 return tensorview if self.lazy else tensorview.compute()
-            for key in self.dataset._tensors.keys():
+            for key in self.dataset._keys_tuple:
                 if subpath.startswith(key):
                     objectview = objv.ObjectView(
                         dataset=self.dataset,
@@ -98,7 +98,7 @@ class DatasetView:
                         lazy=self.lazy,
                     )
                     return objectview if self.lazy else objectview.compute()
-            return self._get_dictionary(self.dataset, subpath, slice=slice_)
+            return self._get_dictionary(subpath, slice_)
         else:
             num, ofs = slice_extract_info(slice_list[0], self.num_samples)
             slice_list[0] = (
@@ -107,7 +107,7 @@ class DatasetView:
                 else slice(ofs + self.offset, ofs + self.offset + num)
             )
             schema_obj = self.dataset.schema.dict_[subpath.split("/")[1]]
-            if subpath in self.dataset._tensors.keys() and (
+            if subpath in self.dataset._tensors and (
                 not isinstance(schema_obj, objv.Sequence) or len(slice_list) <= 1
             ):
                 tensorview = TensorView(
@@ -117,7 +117,7 @@ class DatasetView:
                     lazy=self.lazy,
                 )
                 return tensorview if self.lazy else tensorview.compute()
-            for key in self.dataset._tensors.keys():
+            for key in self.dataset._keys_tuple:
                 if subpath.startswith(key):
                     objectview = objv.ObjectView(
                         dataset=self.dataset,
@@ -155,9 +155,9 @@ class DatasetView:
                 if self.squeeze_dim
                 else slice(self.offset, self.offset + self.num_samples)
             )
-            if subpath in self.dataset._tensors.keys():
+            if subpath in self.dataset._tensors:
                 self.dataset._tensors[subpath][slice_] = assign_value  # Add path check
-            for key in self.dataset._tensors.keys():
+            for key in self.dataset._keys_tuple:
                 if subpath.startswith(key):
                     objv.ObjectView(
                         dataset=self.dataset, subpath=subpath, slice_list=[slice_]
@@ -175,12 +175,12 @@ class DatasetView:
                 else ofs + self.offset
             )
             # self.dataset._tensors[subpath][slice_list] = assign_value
-            if subpath in self.dataset._tensors.keys():
+            if subpath in self.dataset._tensors:
                 self.dataset._tensors[subpath][
                     slice_list
                 ] = assign_value  # Add path check
                 return
-            for key in self.dataset._tensors.keys():
+            for key in self.dataset._keys_tuple:
                 if subpath.startswith(key):
                     objv.ObjectView(
                         dataset=self.dataset, subpath=subpath, slice_list=slice_list
@@ -195,26 +195,22 @@ class DatasetView:
 
     def _get_dictionary(self, subpath, slice_):
         """Gets dictionary from dataset given incomplete subpath"""
-        tensor_dict = {}
         subpath = subpath if subpath.endswith("/") else subpath + "/"
-        for key in self.dataset._tensors.keys():
-            if key.startswith(subpath):
-                suffix_key = key[len(subpath) :]
-                split_key = suffix_key.split("/")
-                cur = tensor_dict
-                for sub_key in split_key[:-1]:
-                    if sub_key not in cur.keys():
-                        cur[sub_key] = {}
-                    cur = cur[sub_key]
-                tensorview = TensorView(
-                    dataset=self.dataset,
-                    subpath=key,
-                    slice_=slice_,
-                    lazy=self.lazy,
-                )
-                cur[split_key[-1]] = tensorview if self.lazy else tensorview.compute()
-        if not tensor_dict:
+        leaves = self.dataset._prefix_index.get(subpath)
+        if not leaves:
             raise KeyError(f"Key {subpath} was not found in dataset")
+        tensor_dict = {}
+        for parents, leaf, key in leaves:
+            cur = tensor_dict
+            for sub_key in parents:
+                cur = cur.setdefault(sub_key, {})
+            tensorview = TensorView(
+                dataset=self.dataset,
+                subpath=key,
+                slice_=slice_,
+                lazy=self.lazy,
+            )
+            cur[leaf] = tensorview if self.lazy else tensorview.compute()
         return tensor_dict
 
     def __iter__(self):
@@ -254,6 +250,7 @@ class DatasetView:
         transform=None,
         inplace=True,
         output_type=dict,
+        prefetch=0,
     ):
         """Converts the dataset into a pytorch compatible format"""
         return self.dataset.to_pytorch(
@@ -262,6 +259,7 @@ class DatasetView:
             offset=self.offset,
             inplace=inplace,
             output_type=output_type,
+            prefetch=prefetch,
         )
 
     def resize_shape(self, size: int) -> None:
@@ -1,5 +1,6 @@
 import hub.api.tests.test_converters
 from hub.schema.features import Tensor
+from hub.schema import ClassLabel, Text
 import numpy as np
 from hub.utils import tfds_loaded, tensorflow_loaded, pytorch_loaded
 import pytest
@@ -112,6 +113,39 @@ def test_to_from_tensorflow_datasetview():
         assert (res_ds["label", "d", "e", i].numpy() == (5 + i) * np.ones((5, 3))).all()
 
 
+@pytest.mark.skipif(not tensorflow_loaded(), reason="requires tensorflow to be loaded")
+def test_to_tensorflow_sources(monkeypatch):
+    # small enough budget for "small" and "label" to be read eagerly, but not "large"
+    monkeypatch.setattr(hub.defaults, "TF_TENSOR_SLICES_LIMIT", 200)
+    my_schema = {
+        "small": Tensor((3,), "int32"),
+        "large": Tensor((20,), "float32"),
+        "dynamic": Tensor((None,), "int64", max_shape=(8,)),
+        "text": Text((None,), max_shape=(10,)),
+        "label": ClassLabel(num_classes=4),
+    }
+    ds = hub.Dataset(
+        schema=my_schema, shape=(10,), url="./data/test_to_tf/sources", mode="w"
+    )
+    for i in range(10):
+        ds["small", i] = i * np.ones(3)
+        ds["large", i] = i * np.ones(20)
+        ds["dynamic", i] = np.arange(i % 8 + 1)
+        ds["text", i] = "text" + str(i)
+        ds["label", i] = i % 4
+
+    tds = ds.to_tensorflow(offset=2, num_samples=6)
+    samples = list(tds)
+    assert len(samples) == 6
+    for i, sample in enumerate(samples, 2):
+        assert (sample["small"].numpy() == ds["small", i].numpy()).all()
+        assert (sample["large"].numpy() == ds["large", i].numpy()).all()
+        assert (sample["dynamic"].numpy() == ds["dynamic", i].numpy()).all()
+        text = "".join(chr(c) for c in sample["text"].numpy().tolist())
+        assert text == ds["text", i].numpy()
+        assert sample["label"].numpy() == ds["label", i].numpy()
+
+
 @pytest.mark.skipif(not pytorch_loaded(), reason="requires pytorch to be loaded")
 def test_to_pytorch():
     import torch
@@ -6,6 +6,7 @@ import pytest
 
 import hub.api.dataset as dataset
 from hub.schema import Tensor, Text, Image
+from hub.store.store import StorageMapWrapperWithCommit
 from hub.utils import (
     gcp_creds_exist,
     hub_creds_exist,
@@ -347,6 +348,15 @@ def test_datasetview_get_dictionary():
     dic = dsv[3, "label"]
     assert (dic["a"].compute() == 5 * np.ones((100, 200))).all()
     assert (dic["d"]["e"].compute() == 3 * np.ones((5, 3))).all()
+    dic = dsv["label"]
+    assert list(dic.keys()) == ["a", "b", "c", "d"]
+    assert (dic["d"]["e"][3].compute() == 3 * np.ones((5, 3))).all()
+    dic = ds["label", "d"]
+    assert list(dic.keys()) == ["e"]
+    dic = ds["label", 5]
+    assert (dic["d"]["e"].compute() == 3 * np.ones((5, 3))).all()
+    with pytest.raises(KeyError):
+        ds["label", "x"]
 
 
 def test_tensorview_slicing():
@@ -533,6 +543,70 @@ def test_datasetview_repr():
     assert dsv.__repr__() == print_text
 
 
+def test_dataset_iter_prefetch():
+    dt = {"first": Tensor(shape=(2,)), "second": {"third": "float"}}
+    ds = Dataset(schema=dt, shape=(10,), url="./data/test/iter_prefetch", mode="w")
+    for i in range(10):
+        ds["first", i] = i * np.ones(2)
+        ds["second", "third", i] = i
+    for prefetch in (0, 1, 4):
+        samples = list(ds.iter(prefetch=prefetch))
+        assert len(samples) == 10
+        for i, sample in enumerate(samples):
+            assert (sample["first"] == i * np.ones(2)).all()
+            assert sample["second"]["third"] == i
+    for i, sample in enumerate(ds.iter(prefetch=2)):
+        if i == 3:
+            break
+    assert i == 3
+
+
+def test_dataset_iter_batched():
+    dt = {
+        "first": Tensor(shape=(2,), chunks=(4,)),
+        "second": Tensor(shape=(None,), max_shape=(5,)),
+        "third": "float",
+    }
+    ds = Dataset(schema=dt, shape=(10,), url="./data/test/iter_batched", mode="w")
+    for i in range(10):
+        ds["first", i] = i * np.ones(2)
+        ds["second", i] = i * np.ones(i % 5 + 1)
+        ds["third", i] = i
+    for batch in (None, 3):
+        samples = list(ds._iter_batched(batch=batch, offset=1, num_samples=8))
+        assert len(samples) == 8
+        for i, (first, second, third) in enumerate(samples, 1):
+            assert (first == i * np.ones(2)).all()
+            assert (second == i * np.ones(i % 5 + 1)).all()
+            assert third == i
+
+
+def test_dataset_flush_batches_chunks(monkeypatch):
+    batches = []
+    setitems = StorageMapWrapperWithCommit.setitems
+
+    def spy_setitems(self, values):
+        batches.append(sorted(values))
+        setitems(self, values)
+
+    monkeypatch.setattr(StorageMapWrapperWithCommit, "setitems", spy_setitems)
+    dt = {"x": Tensor(shape=(2,), dtype="int32", chunks=4)}
+    ds = Dataset(
+        schema=dt,
+        shape=(16,),
+        url="./data/test/flush_batches",
+        mode="w",
+        storage_cache=0,
+    )
+    batches.clear()
+    ds["x", 0:16] = np.arange(32, dtype="int32").reshape(16, 2)
+    ds.flush()
+    assert [batch for batch in batches if "0.0" in batch] == [
+        ["0.0", "1.0", "2.0", "3.0"]
+    ]
+    assert ds["x", 5].numpy().tolist() == [10, 11]
+
+
 if __name__ == "__main__":
     test_datasetview_repr()
     test_datasetview_get_dictionary()
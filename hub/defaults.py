@@ -3,3 +3,5 @@ OBJECT_CHUNK = 128
 DEFAULT_COMPRESSOR = "default"
 DEFAULT_MEMORY_CACHE_SIZE = 2 ** 26
 DEFAULT_STORAGE_CACHE_SIZE = 2 ** 28
+TF_TENSOR_SLICES_LIMIT = 2 ** 26
+FLUSH_BATCH_SIZE = 2 ** 26
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+import threading
+
+
+class ChunkCache:
+    def __init__(self, max_size):
+        """Creates LRU cache of decompressed chunks, keyed by (tensor_key, chunk_id)
+        max_size -> maximum total nbytes of cached chunks that is allowed
+        """
+        self._max_size = max_size
+        self._mutex = threading.Lock()
+        self._total_cached = 0
+        self._cached_items = OrderedDict()
+        # tensor_key -> number of invalidations, put skips chunks read before a write
+        self._generations = {}
+
+    def __getstate__(self):
+        # cached chunks are not pickled, the cache starts empty in the new process
+        return {"_max_size": self._max_size}
+
+    def __setstate__(self, state):
+        self.__init__(state["_max_size"])
+
+    def get(self, tensor_key, chunk_id):
+        """Returns cached chunk, or None if it is not in the cache"""
+        key = (tensor_key, chunk_id)
+        with self._mutex:
+            chunk = self._cached_items.get(key)
+            if chunk is not None:
+                self._cached_items.move_to_end(key)
+            return chunk
+
+    def generation(self, tensor_key):
+        """Returns invalidation generation of the tensor,
+        to be captured before reading a chunk from storage
+        """
+        with self._mutex:
+            return self._generations.get(tensor_key, 0)
+
+    def put(self, tensor_key, chunk_id, chunk, generation):
+        """Puts chunk into the cache, evicting least recently used chunks if needed.
+        Does nothing if the tensor was invalidated since generation was captured,
+        as the chunk may have been read before a write.
+        Cached chunks are made read-only, readers should copy what they return
+        """
+        if chunk.nbytes > self._max_size:
+            return
+        key = (tensor_key, chunk_id)
+        with self._mutex:
+            if self._generations.get(tensor_key, 0) != generation:
+                return
+            chunk.flags.writeable = False
+            if key in self._cached_items:
+                self._total_cached -= self._cached_items.pop(key).nbytes
+            while (
+                self._total_cached > 0
+                and chunk.nbytes + self._total_cached > self._max_size
+            ):
+                _, evicted = self._cached_items.popitem(last=False)
+                self._total_cached -= evicted.nbytes
+            self._cached_items[key] = chunk
+            self._total_cached += chunk.nbytes
+
+    def invalidate(self, tensor_key, chunk_ids=None):
+        """Drops given chunks of the tensor from the cache, all of them if chunk_ids is None"""
+        with self._mutex:
+            self._generations[tensor_key] = self._generations.get(tensor_key, 0) + 1
+            if chunk_ids is None:
+                keys = [key for key in self._cached_items if key[0] == tensor_key]
+            else:
+                keys = [(tensor_key, chunk_id) for chunk_id in chunk_ids]
+            for key in keys:
+                chunk = self._cached_items.pop(key, None)
+                if chunk is not None:
+                    self._total_cached -= chunk.nbytes
+
+    def __len__(self):
+        return len(self._cached_items)
@@ -44,6 +44,8 @@ class DynamicTensor:
         dtype="float64",
         chunks=None,
         compressor=DEFAULT_COMPRESSOR,
+        chunk_cache=None,
+        cache_key=None,
     ):
         """Constructor
         Parameters
@@ -61,6 +63,10 @@ class DynamicTensor:
         chunks : Tuple[int] | True
             How to split the tensor into chunks (files) (default is True)
             If chunks=True then chunksize will automatically be detected
+        chunk_cache : ChunkCache, optional
+            Cache of decompressed chunks shared between tensors, used for reads of static tensors
+        cache_key : str, optional
+            Key of this tensor in chunk_cache
 
         """
         if not (shape is None):
@@ -149,6 +155,16 @@ class DynamicTensor:
                 if item[0] != item[1]:
                     raise DynamicTensorShapeException("not_equal")
         self._enabled_dynamicness = True
+        # only static tensors chunked along the first dim only are cached,
+        # so that a cached chunk is exactly one chunk of the storage tensor
+        self._chunk_cache = (
+            chunk_cache
+            if self._dynamic_tensor is None
+            and self.dtype != "O"
+            and tuple(self.chunks[1:]) == tuple(self.max_shape[1:])
+            else None
+        )
+        self._cache_key = cache_key
 
     def __getitem__(self, slice_):
         """Gets a slice or slices from tensor"""
@@ -173,8 +189,73 @@ class DynamicTensor:
         # Extend slice_ to dim count
         slice_ += [slice(0, None, 1) for i in self.max_shape[len(slice_) :]]
         slice_ = self._get_slice(slice_, real_shapes)
+        if self._chunk_cache is not None:
+            chunk_id = self._single_chunk_id(slice_[0])
+            if chunk_id is not None:
+                return self._get_from_chunk(chunk_id, slice_)
         return self._storage_tensor[slice_]
 
+    def _single_chunk_id(self, sample_slice):
+        """Returns id of the chunk along the first dim that holds the whole sample_slice,
+        None if it spans several chunks or can't be resolved without the storage
+        """
+        chunk_len = self.chunks[0]
+        length = self._storage_tensor.shape[0]
+        if isinstance(sample_slice, int):
+            if 0 <= sample_slice < length:
+                return sample_slice // chunk_len
+            return None
+        if (
+            isinstance(sample_slice, slice)
+            and sample_slice.step in (None, 1)
+            and sample_slice.start is not None
+            and sample_slice.stop is not None
+            and 0 <= sample_slice.start < sample_slice.stop <= length
+            and sample_slice.start // chunk_len == (sample_slice.stop - 1) // chunk_len
+        ):
+            return sample_slice.start // chunk_len
+        return None
+
+    def _get_from_chunk(self, chunk_id, slice_):
+        """Reads slice_ out of a cached chunk, reading the chunk through on a miss"""
+        chunk = self._chunk_cache.get(self._cache_key, chunk_id)
+        if chunk is None:
+            generation = self._chunk_cache.generation(self._cache_key)
+            start = chunk_id * self.chunks[0]
+            chunk = self._storage_tensor[start : start + self.chunks[0]]
+            self._chunk_cache.put(self._cache_key, chunk_id, chunk, generation)
+        sample_slice = slice_[0]
+        offset = chunk_id * self.chunks[0]
+        if isinstance(sample_slice, int):
+            sample_slice -= offset
+        else:
+            sample_slice = slice(
+                sample_slice.start - offset, sample_slice.stop - offset
+            )
+        result = chunk[(sample_slice,) + tuple(slice_[1:])]
+        # copy, so that callers never get a view into the cached chunk
+        return result.copy() if isinstance(result, np.ndarray) else result
+
+    def _invalidate_chunks(self, sample_slice):
+        """Drops chunks touched by a write to sample_slice from the chunk cache"""
+        chunk_len = self.chunks[0]
+        if isinstance(sample_slice, int) and sample_slice >= 0:
+            chunk_ids = [sample_slice // chunk_len]
+        elif (
+            isinstance(sample_slice, slice)
+            and sample_slice.step in (None, 1)
+            and (sample_slice.start or 0) >= 0
+            and sample_slice.stop is not None
+            and sample_slice.stop >= 0
+        ):
+            chunk_ids = range(
+                (sample_slice.start or 0) // chunk_len,
+                (sample_slice.stop - 1) // chunk_len + 1,
+            )
+        else:
+            chunk_ids = None
+        self._chunk_cache.invalidate(self._cache_key, chunk_ids)
+
     def __setitem__(self, slice_, value):
         """Sets a slice or slices with a value"""
         if not isinstance(slice_, abc.Iterable):
@@ -217,7 +298,11 @@ class DynamicTensor:
 
         slice_ = self._get_slice(slice_, real_shapes)
         value = self.check_value_shape(value, slice_)
-        self._storage_tensor[slice_] = value
+        try:
+            self._storage_tensor[slice_] = value
+        finally:
+            if self._chunk_cache is not None:
+                self._invalidate_chunks(slice_[0])
 
     def check_value_shape(self, value, slice_):
         """Checks if value can be set to the slice"""
@@ -262,6 +347,8 @@ class DynamicTensor:
         self.shape = (size,) + self.shape[1:]
         self.max_shape = (size,) + self.max_shape[1:]
         self._resize_shape(self._storage_tensor, size)
+        if self._chunk_cache is not None:
+            self._chunk_cache.invalidate(self._cache_key)
 
         if self._dynamic_tensor:
             self._resize_shape(self._dynamic_tensor, size)
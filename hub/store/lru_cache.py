@@ -1,19 +1,13 @@
 from collections import OrderedDict
 from collections.abc import MutableMapping
+import threading
 
+from hub.defaults import FLUSH_BATCH_SIZE
 
-class DummyLock:
-    def __init__(self):
-        pass
-
-    def __enter__(self):
-        return self
-
-    def __exit__(self, *args):
-        pass
 
-
-Lock = DummyLock
+# tf.data and prefetch threads read through the cache concurrently,
+# the lock only guards bookkeeping, reads and writes of actual storage happen outside it
+Lock = threading.Lock
 
 
 class LRUCache(MutableMapping):
@@ -26,7 +20,9 @@ class LRUCache(MutableMapping):
         """Creates LRU cache using cache_storage and actual_storage containers
         max_size -> maximum cache size that is allowed
         """
-        self._dirty = set()
+        # dirty key -> version of its last write, so that flush keeps keys rewritten meanwhile
+        self._dirty = dict()
+        self._version = 0
         self._mutex = Lock()
         self._max_size = max_size
         self._cache_storage = cache_storage
@@ -55,10 +51,48 @@ class LRUCache(MutableMapping):
     def __exit__(self, *args):
         self.close()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_mutex"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._mutex = Lock()
+
     def _flush_dirty(self):
-        for item in self._dirty:
-            self._actual_storage[item] = self._cache_storage[item]
-        self._dirty.clear()
+        with self._mutex:
+            dirty = list(self._dirty.items())
+        # write dirty items in batches of up to FLUSH_BATCH_SIZE bytes
+        batch, batch_size = {}, 0
+        for item, version in dirty:
+            with self._mutex:
+                if self._dirty.get(item) != version:
+                    # already written by eviction or rewritten, a later flush handles it
+                    continue
+                value = self._cache_storage[item]
+            batch[(item, version)] = value
+            batch_size += len(value)
+            if batch_size >= FLUSH_BATCH_SIZE:
+                self._write_batch(batch)
+                batch, batch_size = {}, 0
+        if batch:
+            self._write_batch(batch)
+
+    def _write_batch(self, batch):
+        """Writes {(key, version): value} to actual storage,
+        then marks keys that were not rewritten meanwhile as clean
+        """
+        values = {item: value for (item, _), value in batch.items()}
+        if hasattr(self._actual_storage, "setitems"):
+            self._actual_storage.setitems(values)
+        else:
+            for item, value in values.items():
+                self._actual_storage[item] = value
+        with self._mutex:
+            for item, version in batch:
+                if self._dirty.get(item) == version:
+                    del self._dirty[item]
 
     def flush(self):
         self._flush_dirty()
@@ -83,11 +117,15 @@ class LRUCache(MutableMapping):
             if key in self._cached_items:
                 self._cached_items.move_to_end(key)
                 return self._cache_storage[key]
-            else:
-                result = self._actual_storage[key]
-                self._free_memory(len(result))
-                self._append_cache(key, result)
-                return result
+        result = self._actual_storage[key]
+        with self._mutex:
+            if key in self._cached_items:
+                # cached by another reader or written meanwhile, the cached value is as new
+                self._cached_items.move_to_end(key)
+                return self._cache_storage[key]
+            self._free_memory(len(result))
+            self._append_cache(key, result)
+        return result
 
     def __setitem__(self, key, value):
         """ Sets item and puts it in the cache if not there"""
@@ -96,8 +134,13 @@ class LRUCache(MutableMapping):
                 self._total_cached -= self._cached_items.pop(key)
             self._free_memory(len(value))
             self._append_cache(key, value)
-            if key not in self._dirty:
-                self._dirty.add(key)
+            self._version += 1
+            self._dirty[key] = self._version
+
+    def setitems(self, values):
+        """ Sets several items, they are written to actual storage together on flush"""
+        for key, value in values.items():
+            self[key] = value
 
     def __delitem__(self, key):
         deleted_from_cache = False
@@ -105,7 +148,7 @@ class LRUCache(MutableMapping):
             if key in self._cached_items:
                 self._total_cached -= self._cached_items.pop(key)
                 del self._cache_storage[key]
-                self._dirty.discard(key)
+                self._dirty.pop(key, None)
                 deleted_from_cache = True
             try:
                 del self._actual_storage[key]
@@ -119,7 +162,8 @@ class LRUCache(MutableMapping):
         )  # TODO: In future might need to fix this to return proper len
 
     def __iter__(self):
-        cached_keys = set(self._dirty)
+        with self._mutex:
+            cached_keys = set(self._dirty)
         for i in self.actual_storage:
             cached_keys.discard(i)
             yield i
@@ -132,7 +176,7 @@ class LRUCache(MutableMapping):
             item, itemsize = self._cached_items.popitem(last=False)
             if item in self._dirty:
                 self._actual_storage[item] = self._cache_storage[item]
-                self._dirty.discard(item)
+                del self._dirty[item]
             del self._cache_storage[item]
             self._total_cached -= itemsize
 
@@ -1,5 +1,6 @@
 import posixpath
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from hub.store.cache import Cache
 from hub.store.lru_cache import LRUCache
 
@@ -143,6 +144,15 @@ class StorageMapWrapperWithCommit(MutableMapping):
     def __setitem__(self, slice_, value):
         self._map[slice_] = value
 
+    def setitems(self, values):
+        """Sets several items, uploading them concurrently as each one is a round trip"""
+        if len(values) <= 1:
+            for key, value in values.items():
+                self._map[key] = value
+            return
+        with ThreadPoolExecutor(max_workers=min(32, len(values))) as executor:
+            list(executor.map(lambda item: self.__setitem__(*item), values.items()))
+
     def __delitem__(self, slice_):
         del self._map[slice_]
 
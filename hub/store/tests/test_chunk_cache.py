@@ -0,0 +1,52 @@
+import pickle
+
+import numpy as np
+
+from hub.store.chunk_cache import ChunkCache
+
+
+def test_chunk_cache():
+    chunk = np.zeros(10, dtype="uint8")
+    cache = ChunkCache(30)
+    cache.put("a", 0, chunk.copy(), 0)
+    cache.put("a", 1, chunk.copy(), 0)
+    cache.put("b", 0, chunk.copy(), 0)
+    assert len(cache) == 3
+    assert not cache.get("a", 0).flags.writeable
+    cache.put("b", 1, chunk.copy(), 0)
+    assert cache.get("a", 1) is None
+    assert cache.get("a", 0) is not None
+    cache.put("b", 2, chunk.copy(), 0)
+    assert cache.get("b", 0) is None
+    assert cache.get("a", 0) is not None
+    cache.put("c", 0, np.zeros(40, dtype="uint8"), 0)
+    assert cache.get("c", 0) is None
+    cache.invalidate("b", [1])
+    assert cache.get("b", 1) is None
+    assert cache.get("b", 2) is not None
+    cache.invalidate("a")
+    assert cache.get("a", 0) is None
+    assert len(cache) == 1
+
+
+def test_chunk_cache_pickle():
+    cache = ChunkCache(30)
+    cache.put("a", 0, np.zeros(10, dtype="uint8"), 0)
+    cache = pickle.loads(pickle.dumps(cache))
+    assert len(cache) == 0
+    cache.put("a", 0, np.zeros(10, dtype="uint8"), 0)
+    assert cache.get("a", 0) is not None
+
+
+def test_chunk_cache_generation():
+    cache = ChunkCache(30)
+    generation = cache.generation("a")
+    cache.invalidate("a", [0])
+    cache.put("a", 0, np.zeros(10, dtype="uint8"), generation)
+    assert cache.get("a", 0) is None
+    cache.put("a", 0, np.zeros(10, dtype="uint8"), cache.generation("a"))
+    assert cache.get("a", 0) is not None
+
+
+if __name__ == "__main__":
+    test_chunk_cache()
@@ -5,6 +5,7 @@ import numpy as np
 import fsspec
 from zarr.creation import create
 
+from hub.store.chunk_cache import ChunkCache
 from hub.store.dynamic_tensor import DynamicTensor
 from hub.store.store import StorageMapWrapperWithCommit
 
@@ -123,6 +124,64 @@ def test_dynamic_tensor_4():
     assert (t[0, 6:8] == np.ones((2, 20, 10), dtype="int32")).all()
 
 
+def test_dynamic_tensor_chunk_cache():
+    cache = ChunkCache(2 ** 20)
+    t = DynamicTensor(
+        create_store("./data/test/test_dynamic_tensor_chunk_cache"),
+        mode="w",
+        shape=(10, 4),
+        max_shape=(10, 4),
+        dtype="int32",
+        chunks=5,
+        chunk_cache=cache,
+        cache_key="t",
+    )
+    t[0:10] = np.arange(40, dtype="int32").reshape(10, 4)
+    assert t[6].tolist() == [24, 25, 26, 27]
+    assert cache.get("t", 1) is not None
+    assert t[7:9, 1].tolist() == [29, 33]
+    a = t[6]
+    a[0] = -1
+    assert t[6, 0] == 24
+    t[6] = np.zeros(4, dtype="int32")
+    assert cache.get("t", 1) is None
+    assert t[6].tolist() == [0, 0, 0, 0]
+    assert t[3:7].tolist()[-1] == [0, 0, 0, 0]
+
+
+def test_dynamic_tensor_chunk_cache_write_race():
+    cache = ChunkCache(2 ** 20)
+    t = DynamicTensor(
+        create_store("./data/test/test_dynamic_tensor_chunk_cache_race"),
+        mode="w",
+        shape=(10, 4),
+        max_shape=(10, 4),
+        dtype="int32",
+        chunks=5,
+        chunk_cache=cache,
+        cache_key="t",
+    )
+    t[0:10] = np.zeros((10, 4), dtype="int32")
+    storage = t._storage_tensor
+
+    class RacingStorage:
+        def __getattr__(self, name):
+            return getattr(storage, name)
+
+        def __getitem__(self, slice_):
+            chunk = storage[slice_]
+            # a writer updates the chunk between this read and the put
+            storage[6] = np.ones(4, dtype="int32")
+            cache.invalidate("t", [1])
+            return chunk
+
+    t._storage_tensor = RacingStorage()
+    assert t[6].tolist() == [0, 0, 0, 0]
+    assert cache.get("t", 1) is None
+    t._storage_tensor = storage
+    assert t[6].tolist() == [1, 1, 1, 1]
+
+
 if __name__ == "__main__":
     test_read_and_append_modes()
     # test_chunk_iterator()
@@ -1,3 +1,7 @@
+import pickle
+import threading
+import time
+
 from hub.store.lru_cache import LRUCache
 
 import zarr
@@ -37,5 +41,69 @@ def test_lru_cache():
     cache.commit()
 
 
+def test_lru_cache_setitems():
+    data = bytes("Hello World", "utf-8")
+    cache = LRUCache(zarr.MemoryStore(), zarr.MemoryStore(), 100)
+    cache.setitems({"Aello": data, "Beta": data})
+    assert list(sorted(cache.cache_storage)) == ["Aello", "Beta"]
+    assert list(sorted(cache.actual_storage)) == []
+    cache.flush()
+    assert list(sorted(cache.actual_storage)) == ["Aello", "Beta"]
+
+
+def test_lru_cache_threads():
+    actual = {str(i): bytes(1000 + i) for i in range(64)}
+    cache = LRUCache({}, actual, 20000)
+
+    def read(start):
+        for i in range(500):
+            cache[str((start + i) % 64)]
+
+    threads = [threading.Thread(target=read, args=(i * 7,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache._total_cached == sum(cache._cached_items.values())
+    assert cache._total_cached <= 20000
+    cache = pickle.loads(pickle.dumps(cache))
+    assert cache["3"] == bytes(1003)
+
+
+class SlowStorage(dict):
+    def __getitem__(self, key):
+        time.sleep(0.05)
+        return super().__getitem__(key)
+
+
+def test_lru_cache_parallel_misses():
+    actual = SlowStorage({str(i): bytes(10) for i in range(16)})
+    cache = LRUCache({}, actual, 1000)
+    threads = [
+        threading.Thread(target=cache.__getitem__, args=(str(i),)) for i in range(16)
+    ]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert time.time() - start < 0.4
+    assert len(cache._cached_items) == 16
+
+
+def test_lru_cache_flush_keeps_rewritten():
+    data = bytes("Hello World", "utf-8")
+    cache = LRUCache({}, {}, 100)
+    cache["Aello"] = data
+    with cache._mutex:
+        dirty = list(cache._dirty.items())
+    cache["Aello"] = data + data
+    cache._write_batch({dirty[0]: data})
+    assert "Aello" in cache._dirty
+    cache.flush()
+    assert cache.actual_storage["Aello"] == data + data
+    assert not cache._dirty
+
+
 if __name__ == "__main__":
     test_lru_cache()
@@ -1,4 +1,9 @@
-from hub.store.store import get_cache_path
+import shutil
+import time
+
+import fsspec
+
+from hub.store.store import get_cache_path, StorageMapWrapperWithCommit
 
 
 def test_get_cache_path():
@@ -12,5 +17,32 @@ def test_get_cache_path():
     assert "./cache/test\\testdb" == get_cache_path("C:\\test\\testdb", cache_folder)
 
 
+class SlowMap(dict):
+    root = ""
+
+    def __setitem__(self, key, value):
+        time.sleep(0.05)
+        super().__setitem__(key, value)
+
+
+def test_storage_map_setitems_concurrent():
+    store = StorageMapWrapperWithCommit(SlowMap())
+    start = time.time()
+    store.setitems({str(i): bytes(10) for i in range(16)})
+    assert time.time() - start < 0.4
+    assert sorted(store) == sorted(str(i) for i in range(16))
+
+
+def test_storage_map_setitems_local_dirs():
+    path = "./data/test/storage_map_setitems"
+    shutil.rmtree(path, ignore_errors=True)
+    fs = fsspec.filesystem("file")
+    fs.makedirs(path, exist_ok=True)
+    store = StorageMapWrapperWithCommit(fs.get_mapper(path))
+    store.setitems({"a/b/0.0": b"first", "c/1.0": b"second"})
+    assert store["a/b/0.0"] == b"first"
+    assert store["c/1.0"] == b"second"
+
+
 if __name__ == "__main__":
     test_get_cache_path()
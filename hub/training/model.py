@@ -2,8 +2,11 @@ import os
 import sys
 from typing import Union, Dict
 import json
+import shutil
 import tempfile
-import io
+from contextlib import contextmanager
+
+from fsspec.implementations.local import LocalFileSystem
 
 from hub.store.store import get_fs_and_path
 
@@ -23,6 +26,50 @@ if tensorflow_spec is not None:
     TENSORFLOW_MODEL_CLASSES = (tf.keras.Model, tf.keras.Sequential)
 
 
+def _import_safetensors_torch():
+    try:
+        import safetensors.torch
+    except ImportError:
+        raise ModuleNotFoundError("Module 'safetensors' is not installed")
+    return safetensors.torch
+
+
+@contextmanager
+def _local_file(fs, path: str):
+    """Yields a local path to the file, downloading it into a temporary directory if it is remote"""
+    if isinstance(fs, LocalFileSystem):
+        yield os.path.expanduser(path)
+        return
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        local_path = os.path.join(tmp_dir, os.path.basename(path))
+        fs.get(path, local_path)
+        yield local_path
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+@contextmanager
+def _upload_file(fs, path: str):
+    """Yields a local path to write the file to, uploading it to `path` afterwards if it is remote"""
+    if isinstance(fs, LocalFileSystem):
+        local_path = os.path.expanduser(path)
+        try:
+            yield local_path
+        except Exception:
+            if os.path.exists(local_path):
+                os.remove(local_path)
+            raise
+        return
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        local_path = os.path.join(tmp_dir, os.path.basename(path))
+        yield local_path
+        fs.put(local_path, path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
 class Model:
     def __init__(self, model=None, metainfo: Dict = dict()):
         """Creates model with given metainfo.
@@ -53,7 +100,9 @@ class Model:
         ----------
         model_path: str
             Path(local or s3) to model file. Should be of type '.h5'
-                    for Tensorflow models and of type '.pth' or '.pt' for PyTorch models.
+                    for Tensorflow models and of type '.pth', '.pt' or '.safetensors' for PyTorch models.
+                    Weights from '.safetensors' files are loaded into the model this object
+                    was created with, or returned as a state dict if there is none.
         token: str
             Path to aws credentials if `model_path` is aws s3 path.
             default: os.environ['AWS_CONFIG_FILE']
@@ -75,17 +124,30 @@ class Model:
                     "Unable to load a model. \
                                         Module 'torch' is not installed"
                 )
-            with fs.open(model_path, "rb") as opened_file:
-                self._model = torch.load(opened_file)
+            with _local_file(fs, model_path) as local_path:
+                self._model = torch.load(local_path)
+        elif model_path.endswith(".safetensors"):
+            if "torch" not in sys.modules:
+                raise ModuleNotFoundError(
+                    "Unable to load a model. \
+                                        Module 'torch' is not installed"
+                )
+            safetensors_torch = _import_safetensors_torch()
+            with _local_file(fs, model_path) as local_path:
+                state_dict = safetensors_torch.load_file(local_path, device="cpu")
+            if self._model is not None:
+                self._model.load_state_dict(state_dict)
+            else:
+                self._model = state_dict
         elif model_path.endswith(".h5"):
             if "tensorflow" not in sys.modules:
                 raise ModuleNotFoundError(
                     "Unable to load a model. \
                                         Module 'tensorflow' is not installed"
                 )
-            with fs.open(model_path, "rb") as opened_file:
-                f = h5py.File(opened_file, "r")
-                self._model = tf.keras.models.load_model(f)
+            with _local_file(fs, model_path) as local_path:
+                with h5py.File(local_path, "r") as f:
+                    self._model = tf.keras.models.load_model(f)
         elif model_path.endswith(".tf"):
             if "tensorflow" not in sys.modules:
                 raise ModuleNotFoundError(
@@ -96,7 +158,7 @@ class Model:
         else:
             raise ValueError("Not supported model type")
 
-    def store(self, model_dir: str, token: str = None):
+    def store(self, model_dir: str, token: str = None, format: str = None):
         """Saves an object to a file.
 
         Usage
@@ -112,6 +174,9 @@ class Model:
         token: str
             Path to aws credentials if `model_dir` is aws s3 path.
             default: os.environ['AWS_CONFIG_FILE']
+        format: str, optional
+            Set to 'safetensors' to store the state dict of a PyTorch model as '.safetensors'
+            instead of pickling the whole model to '.pth'. Ignored for Tensorflow models.
 
         Raises
         ----------
@@ -129,18 +194,25 @@ class Model:
         if "PYTORCH_MODEL_CLASSES" in globals() and issubclass(
             model_class, PYTORCH_MODEL_CLASSES
         ):
-            model_full_path = os.path.join(url, model_class.__name__ + ".pth")
-            with fs.open(model_full_path, "wb") as opened_file:
-                torch.save(self._model, opened_file)
+            if format == "safetensors":
+                safetensors_torch = _import_safetensors_torch()
+                model_full_path = os.path.join(
+                    url, model_class.__name__ + ".safetensors"
+                )
+                with _upload_file(fs, model_full_path) as local_path:
+                    safetensors_torch.save_file(self._model.state_dict(), local_path)
+            else:
+                model_full_path = os.path.join(url, model_class.__name__ + ".pth")
+                with _upload_file(fs, model_full_path) as local_path:
+                    torch.save(self._model, local_path)
         elif "TENSORFLOW_MODEL_CLASSES" in globals() and issubclass(
             model_class, TENSORFLOW_MODEL_CLASSES
         ):
             try:
                 model_full_path = os.path.join(url, model_class.__name__ + ".h5")
-                io_h5 = io.BytesIO()
-                self._model.save(io_h5)
-                with fs.open(model_full_path, "wb") as opened_file:
-                    opened_file.write(io_h5.getbuffer())
+                with _upload_file(fs, model_full_path) as local_path:
+                    with open(local_path, "w+b") as opened_file:
+                        self._model.save(opened_file)
             except TypeError:
                 model_full_path = os.path.join(url, model_class.__name__ + ".tf")
                 self._model.save(model_full_path)
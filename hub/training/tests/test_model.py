@@ -1,6 +1,6 @@
 import numpy as np
 import pytest
-from hub.utils import pytorch_loaded, tensorflow_loaded
+from hub.utils import pytorch_loaded, tensorflow_loaded, safetensors_loaded
 from hub.training.model import Model
 
 import importlib
@@ -37,6 +37,33 @@ def test_store_load_torch():
         assert torch.equal(p1[1].data, p2[1].data)
 
 
+@pytest.mark.skipif(
+    not pytorch_loaded() or not safetensors_loaded(),
+    reason="requires pytorch and safetensors to be loaded",
+)
+def test_store_load_torch_safetensors():
+    model_arch = torch.nn.Sequential(
+        torch.nn.Linear(1000, 100),
+        torch.nn.ReLU(),
+        torch.nn.Linear(100, 10),
+    )
+    model_init = Model(model_arch)
+    model_init.store("./data/", format="safetensors")
+    loaded_model = Model(
+        torch.nn.Sequential(
+            torch.nn.Linear(1000, 100),
+            torch.nn.ReLU(),
+            torch.nn.Linear(100, 10),
+        )
+    )
+    loaded_model.load(f"./data/{model_init._model.__class__.__name__}.safetensors")
+    for (p1, p2) in zip(
+        model_init._model.named_parameters(), loaded_model._model.named_parameters()
+    ):
+        assert p1[0] == p2[0]
+        assert torch.equal(p1[1].data, p2[1].data)
+
+
 @pytest.mark.skipif(
     not tensorflow_loaded(),
     reason="requires tensorflow to be loaded",
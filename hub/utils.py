@@ -1,3 +1,4 @@
+from functools import reduce
 from math import gcd
 import time
 from collections import abc
@@ -115,6 +116,16 @@ def tfds_loaded():
     return True
 
 
+def safetensors_loaded():
+    try:
+        import safetensors
+
+        safetensors.__version__
+    except ImportError:
+        return False
+    return True
+
+
 def transformers_loaded():
     try:
         import transformers
@@ -135,16 +146,21 @@ def pathos_loaded():
     return True
 
 
+try:
+    from math import lcm as _lcm
+except ImportError:  # python < 3.9
+
+    def _lcm(*integers):
+        return reduce(lambda x, y: x * y // gcd(x, y), integers, 1)
+
+
 def compute_lcm(a):
     """
     Lowest Common Multiple of a list a
     """
     if not a:
         return None
-    lcm = a[0]
-    for i in a[1:]:
-        lcm = lcm * i // gcd(lcm, i)
-    return int(lcm)
+    return int(_lcm(*a))
 
 
 def batchify(iterable, n=1):